@@ -15,7 +15,7 @@ Goal Definition:
 Constraints:
 This code needs to calibrate this tension array by finding valid travel ranges for each motor and then use this information to control the robot in a cartesian coordinate system going from 0 to 100 for each axis and apply to a safe zone of about 80% of the full size of the available space.
 
-Make sure that at any given moment, no motor is running faster than the MAX_SPEED_ANGLE_PER_SEC. During calibration, not faster than SPEED_MAX_ANGLE_PER_SEC_CALIBRATION. The STALL_TENSION_CLUTCH_DUTY_LIMIT is the value at which a motor stalls but still puts it end of the string under tension with its spring without triggering the safety clutch. The STALL_COLLISION_CLUTCH_DUTY_LIMIT is to be used when looking for minimum travel, i.e. when the disk is at danger to be pulled inside of anyone motor. The RELAX_TIME is the time in which the motors are relaxed, reeling out, to let the clutch settle. The RELAX_SETTLE_TIME is the time in which we simply wait for the springs inside of the mechanisms to recover. Acting too fast, will prematurely trigger stall detections in following steps.
+Make sure that at any given moment, no motor is running faster than the MAX_SPEED_ANGLE_PER_SEC. During calibration, not faster than SPEED_MAX_ANGLE_PER_SEC_CALIBRATION, except for the duty limited tensioning approach while a string is still slack, which may reel in at twice that speed (SPEED_CAL_APPROACH). The STALL_TENSION_CLUTCH_DUTY_LIMIT is the value at which a motor stalls but still puts it end of the string under tension with its spring without triggering the safety clutch. The STALL_COLLISION_CLUTCH_DUTY_LIMIT is to be used when looking for minimum travel, i.e. when the disk is at danger to be pulled inside of anyone motor. The RELAX_TIME is the time in which the motors are relaxed, reeling out, to let the clutch settle. The RELAX_SETTLE_TIME is the time in which we simply wait for the springs inside of the mechanisms to recover. Acting too fast, will prematurely trigger stall detections in following steps.
 
 In general, be conservative with speed during calibration and orientate yourself on the max speed during operating within the safe zone cartesian coordinate system. Since the space can be very rectangular, keep in mind that some motors need to be faster than others to compensate.
 
@@ -25,18 +25,24 @@ Stall detection is useful for detecting limits by using the run_until_stalled me
 The documentation for the pybricks library can be found here: https://docs.pybricks.com/en/latest/index.html where the relevant page for the motors is this page https://docs.pybricks.com/en/latest/pupdevices/motor.html and for multi tasking this page https://docs.pybricks.com/en/latest/tools/index.html
 """  # noqa: E501 # pylint: disable=line-too-long
 
+from micropython import const
 from pybricks.hubs import InventorHub
-from pybricks.parameters import Color, Direction, Port, Stop
+from pybricks.parameters import Button, Color, Direction, Port, Stop
 from pybricks.pupdevices import Motor
-from pybricks.tools import multitask, run_task, wait
+from pybricks.tools import StopWatch, multitask, run_task, wait
+from umath import sqrt
+from ustruct import calcsize, pack, unpack
 
 hub = InventorHub()
 
 hub.light.blink(Color.GREEN, [500, 500])
 
+# Hold the left button while starting the program to discard a stored calibration
+recalibrate = Button.LEFT in hub.buttons.pressed()
+
 # Model Constants
 
-STALL_TENSION_CLUTCH_DUTY_LIMIT = 20
+STALL_TENSION_CLUTCH_DUTY_LIMIT = const(20)
 """
 Stall sensitivity before clutch triggers during tensioning.
 
@@ -51,7 +57,7 @@ Value           Value       Ratio           Motor                           Reel
                 35          1:1   (1/1)     Dark Grey Gear 24 (24505)       -> Dark Grey Gear 24 (24505)
 """
 
-STALL_COLLISION_CLUTCH_DUTY_LIMIT = 17
+STALL_COLLISION_CLUTCH_DUTY_LIMIT = const(17)
 """
 Stall sensitivity before clutch triggers when forcing disk into motor.
 
@@ -67,794 +73,663 @@ Value           Value       Ratio           Motor                           Reel
                 30          1:1   (1/1)     Dark Grey Gear 24 (24505)       -> Dark Grey Gear 24 (24505)
 """
 
-SPEED_MAX_ANGLE_PER_SEC_CALIBRATION = 300
-SPEED_MAX_ANGLE_PER_SEC = 1500
+SPEED_MAX_ANGLE_PER_SEC_CALIBRATION = const(300)
+SPEED_MAX_ANGLE_PER_SEC = const(1500)
+
+RELAX_TIME = const(1500)
+RELAX_SETTLE_TIME = const(500)
+
+CALIBRATION_TOLERANCE = const(20)
+"""
+Max deviation in degrees of the tensioned calibration origin from the stored travel center, to restore a calibration.
+"""
+
+APPROACH_SLOW_DOWN_LOAD = const(25)
+"""
+Load in mNm at which a fast tensioning approach slows down to calibration speed.
+
+About 60% of the avg load at which the tensioning stall triggers with the default self made reel (41 mNm).
+"""
+
+STALL_WATCHDOG_SPEED = const(5)
+STALL_WATCHDOG_TIME = const(100)
+"""
+A motor that turned slower than STALL_WATCHDOG_SPEED deg/s for STALL_WATCHDOG_TIME ms is considered stalled.
+
+Catches a stall before the duty limit detection does, which needs longer and overshoots more at higher speeds.
+"""
 
-RELAX_TIME = 1500
-RELAX_SETTLE_TIME = 500
+VERBOSE = False
+"""
+Print the full parameter status after every intermediate calibration step, not only once calibration completed.
+"""
 
 ###########################################################
 # Motors
 ###########################################################
 
-# Speed Direction Sign Multiplier
-reel_in = 1
-reel_out = reel_in * -1
+# Signed Speeds
+#
+# The positive direction of every motor below is set up to reel in.
+
+SPEED_CAL_IN = const(SPEED_MAX_ANGLE_PER_SEC_CALIBRATION)
+SPEED_CAL_OUT = const(-SPEED_MAX_ANGLE_PER_SEC_CALIBRATION)
+
+# Only while a string is slack, the tensioning approach may reel in faster, as it is still duty limited
+SPEED_CAL_APPROACH = const(2 * SPEED_MAX_ANGLE_PER_SEC_CALIBRATION)
 
 # ---------------------------------------------------------
 # ↖ Top Left
 top_left = Motor(Port.A, positive_direction=Direction.COUNTERCLOCKWISE)
 
-# Calibration Origin
-top_left_calibration_initial = None
-top_left_calibration_tensioned = None
-
-# Travel Range
-top_left_travel_min = None
-top_left_travel_max = None
-top_left_travel_center = None
-top_left_travel_left_neighbor = None
-top_left_travel_right_neighbor = None
-
-# ---------------------------------------------------------
 # ↘ Bottom Right
 bottom_right = Motor(Port.F, positive_direction=Direction.COUNTERCLOCKWISE)
 
-# Calibration Origin
-bottom_right_calibration_initial = None
-bottom_right_calibration_tensioned = None
+# ↗ Top Right
+top_right = Motor(Port.B)
 
-# Travel Range
-bottom_right_travel_min = None
-bottom_right_travel_max = None
-bottom_right_travel_center = None
-bottom_right_travel_left_neighbor = None
-bottom_right_travel_right_neighbor = None
+# ↙ Bottom Left
+bottom_left = Motor(Port.E)
 
 # ---------------------------------------------------------
-# ↗ Top Right
-top_right = Motor(Port.B)
+# Motor Registry
+#
+# All per motor state is kept as one list per parameter (structure of arrays),
+# indexed by the motor index below. Stages read and write e.g. travel_min[TL]
+# instead of a dedicated module-level name per motor and parameter.
 
-# Calibration Origin
-top_right_calibration_initial = None
-top_right_calibration_tensioned = None
+TL = const(0)
+BR = const(1)
+TR = const(2)
+BL = const(3)
 
-# Travel Range
-top_right_travel_min = None
-top_right_travel_max = None
-top_right_travel_center = None
-top_right_travel_left_neighbor = None
-top_right_travel_right_neighbor = None
+MOTORS = (top_left, bottom_right, top_right, bottom_left)
+LABELS = ("↖ Top Left", "↘ Bottom Right", "↗ Top Right", "↙ Bottom Left")
 
-# ---------------------------------------------------------
-# ↙ Bottom Left
-bottom_left = Motor(Port.E)
+# Corner position of each motor within the frame, x to the right and y downwards
+CORNER_X = (0, 1, 1, 0)
+CORNER_Y = (0, 1, 0, 1)
 
 # Calibration Origin
-bottom_left_calibration_initial = None
-bottom_left_calibration_tensioned = None
+calibration_initial = [None] * 4
+calibration_tensioned = [None] * 4
 
 # Travel Range
-bottom_left_travel_min = None
-bottom_left_travel_max = None
-bottom_left_travel_center = None
-bottom_left_travel_left_neighbor = None
-bottom_left_travel_right_neighbor = None
+travel_min = [None] * 4
+travel_max = [None] * 4
+travel_center = [None] * 4
+travel_left_neighbor = [None] * 4
+travel_right_neighbor = [None] * 4
 
+# Frame Size (width, height) in degrees of reel rotation
+frame_size = [None, None]
 
-def print_parameter_status(title: str = "Current Parameters"):
-    print("")
-    print(f"[{title}] ---------------------------------")
-    print("")
-    print("↖ Top Left")
-    print("  > Current Angle:", top_left.angle())
-    print("  - top_left_travel_min:", top_left_travel_min)
-    print("  - top_left_travel_max:", top_left_travel_max)
-    print("  - top_left_travel_center:", top_left_travel_center)
-    print("  - top_left_travel_left_neighbor:", top_left_travel_left_neighbor)
-    print("  - top_left_travel_right_neighbor:", top_left_travel_right_neighbor)
-    print("  - top_left_calibration_initial:", top_left_calibration_initial)
-    print("  - top_left_calibration_tensioned:", top_left_calibration_tensioned)
-    print("")
-    print("↘ Bottom Right")
-    print("  > Current Angle:", bottom_right.angle())
-    print("  - bottom_right_travel_min:", bottom_right_travel_min)
-    print("  - bottom_right_travel_max:", bottom_right_travel_max)
-    print("  - bottom_right_travel_center:", bottom_right_travel_center)
-    print("  - bottom_right_travel_left_neighbor:", bottom_right_travel_left_neighbor)
-    print("  - bottom_right_travel_right_neighbor:", bottom_right_travel_right_neighbor)
-    print("  - bottom_right_calibration_initial:", bottom_right_calibration_initial)
-    print("  - bottom_right_calibration_tensioned:", bottom_right_calibration_tensioned)
-    print("")
-    print("↗ Top Right")
-    print("  > Current Angle:", top_right.angle())
-    print("  - top_right_travel_min:", top_right_travel_min)
-    print("  - top_right_travel_max:", top_right_travel_max)
-    print("  - top_right_travel_center:", top_right_travel_center)
-    print("  - top_right_travel_left_neighbor:", top_right_travel_left_neighbor)
-    print("  - top_right_travel_right_neighbor:", top_right_travel_right_neighbor)
-    print("  - top_right_calibration_initial:", top_right_calibration_initial)
-    print("  - top_right_calibration_tensioned:", top_right_calibration_tensioned)
-    print("")
-    print("↙ Bottom Left")
-    print("  > Current Angle:", bottom_left.angle())
-    print("  - bottom_left_travel_min:", bottom_left_travel_min)
-    print("  - bottom_left_travel_max:", bottom_left_travel_max)
-    print("  - bottom_left_travel_center:", bottom_left_travel_center)
-    print("  - bottom_left_travel_left_neighbor:", bottom_left_travel_left_neighbor)
-    print("  - bottom_left_travel_right_neighbor:", bottom_left_travel_right_neighbor)
-    print("  - bottom_left_calibration_initial:", bottom_left_calibration_initial)
-    print("  - bottom_left_calibration_tensioned:", bottom_left_calibration_tensioned)
-    print("")
-    print("------------------------------------------------------")
 
+def snapshot():
+    """
+    Reads the current angle of all motors at once, ordered as MOTORS.
+    """
+    return [MOTORS[i].angle() for i in range(4)]
 
-###########################################################
-# Monitoring
-###########################################################
 
-
-async def log_load(every_ms: int = 200):
-    while True:
-        print(
-            "Speed deg/s (Load mNm) [TL, BR, TR, BL]",
-            f"{top_left.speed()} ({top_left.load()})",
-            f"{bottom_right.speed()} ({bottom_right.load()})",
-            f"{top_right.speed()} ({top_right.load()})",
-            f"{bottom_left.speed()} ({bottom_left.load()})",
-        )
-
-        await wait(every_ms)
+def format_angles(angles) -> str:
+    """
+    Formats one angle per motor, ordered as MOTORS, into a single string.
+    """
+    return "TL=%d BR=%d TR=%d BL=%d" % tuple(angles)
 
 
-def run_task_monitored(task):
-    async def runner():
-        await multitask(task, log_load(), race=True)
+STATUS_FORMAT = """
+[%s] ---------------------------------
 
-    run_task(runner())
+Frame Size (width, height): %s
 
+%s
+------------------------------------------------------"""
 
-###########################################################
-# Solving Stages
-###########################################################
+STATUS_MOTOR_FORMAT = """%s
+  > Current Angle: %s
+  - travel_min: %s
+  - travel_max: %s
+  - travel_center: %s
+  - travel_left_neighbor: %s
+  - travel_right_neighbor: %s
+  - calibration_initial: %s
+  - calibration_tensioned: %s
+"""
 
 
-# Stage 1.1: Make sure everything is in tension
-async def bring_under_tension(speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION):
-    await multitask(
-        top_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        top_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
+def print_parameter_status(title: str = "Current Parameters"):
+    angles = snapshot()
+    motors = "\n".join(
+        STATUS_MOTOR_FORMAT
+        % (
+            LABELS[i],
+            angles[i],
+            travel_min[i],
+            travel_max[i],
+            travel_center[i],
+            travel_left_neighbor[i],
+            travel_right_neighbor[i],
+            calibration_initial[i],
+            calibration_tensioned[i],
+        )
+        for i in range(4)
     )
 
+    # Emit as one write, each print is flushed to the host separately
+    print(STATUS_FORMAT % (title, frame_size, motors))
 
-top_left_calibration_initial = top_left.angle()
-bottom_right_calibration_initial = bottom_right.angle()
-top_right_calibration_initial = top_right.angle()
-bottom_left_calibration_initial = bottom_left.angle()
 
-print(
-    "Stage 1.1 (START): Tensioning all motors from [TL, BR, TR, BL]",
-    top_left_calibration_initial,
-    bottom_right_calibration_initial,
-    top_right_calibration_initial,
-    bottom_left_calibration_initial,
-)
+###########################################################
+# Calibration Storage
+###########################################################
 
-run_task_monitored(bring_under_tension())
+CALIBRATION_STORAGE_MAGIC = 0x43424332
+CALIBRATION_STORAGE_FORMAT = "<21i"
+"""
+Magic, travel center (mod 360) and the four travel lists relative to the travel center.
 
-top_left_calibration_tensioned = top_left.angle()
-bottom_right_calibration_tensioned = bottom_right.angle()
-top_right_calibration_tensioned = top_right.angle()
-bottom_left_calibration_tensioned = bottom_left.angle()
+Every run leaves the disc at the travel center, so the next run tensions from there. Motor angles are only absolute
+within one turn after a reboot, hence travel is stored relative to the center and matched against the next tensioned
+calibration origin.
+"""
 
-print(
-    "Stage 1.1 (END): All motors tensioned to [TL, BR, TR, BL]",
-    top_left_calibration_tensioned,
-    bottom_right_calibration_tensioned,
-    top_right_calibration_tensioned,
-    bottom_left_calibration_tensioned,
-)
 
+def save_calibration():
+    """
+    Stores the travel ranges in the persistent storage of the hub.
+    """
+    values = [CALIBRATION_STORAGE_MAGIC]
+    values += [travel_center[i] % 360 for i in range(4)]
+    for travel in (travel_min, travel_max, travel_left_neighbor, travel_right_neighbor):
+        values += [travel[i] - travel_center[i] for i in range(4)]
 
-# Stage 1.2: Relax all motors for a brief moment to relax the clutch
-def relax_tension(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
-    time: int = RELAX_TIME,
-    add_wait: int = RELAX_SETTLE_TIME,
-):
-    top_left.run_time(
-        speed=speed * reel_out,
-        time=time,
-        then=Stop.COAST,
-        wait=False,
-    )
-    bottom_right.run_time(
-        speed=speed * reel_out,
-        time=time,
-        then=Stop.COAST,
-        wait=False,
-    )
-    top_right.run_time(
-        speed=speed * reel_out,
-        time=time,
-        then=Stop.COAST,
-        wait=False,
-    )
-    bottom_left.run_time(
-        speed=speed * reel_out,
-        time=time,
-        then=Stop.COAST,
-        wait=False,
-    )
+    hub.system.storage(0, write=pack(CALIBRATION_STORAGE_FORMAT, *values))
 
-    wait(time + add_wait)
 
+def load_calibration(tolerance: int = CALIBRATION_TOLERANCE) -> bool:
+    """
+    Restores the travel ranges stored by save_calibration relative to the current tensioned calibration origin, which
+    is the travel center the previous run left the disc at.
 
-relax_tension()
+    Returns False without restoring anything, if nothing is stored or any motors tensioned calibration origin is off
+    from the stored travel center by more than tolerance degrees, i.e. the rig was disturbed since.
+    """
+    size = calcsize(CALIBRATION_STORAGE_FORMAT)
+    values = unpack(CALIBRATION_STORAGE_FORMAT, hub.system.storage(0, read=size))
 
-print(
-    "Stage 1.2 (END): All motors relaxed [TL, BR, TR, BL]",
-    top_left.angle(),
-    bottom_right.angle(),
-    top_right.angle(),
-    bottom_left.angle(),
-)
+    if values[0] != CALIBRATION_STORAGE_MAGIC:
+        return False
 
+    for i in range(4):
+        drift = (calibration_tensioned[i] - values[1 + i]) % 360
+        if min(drift, 360 - drift) > tolerance:
+            return False
 
-# Stage 2.1.1: Go to top left zero position, stop all when stalled
-async def travel_to_top_left_zero_position(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
-):
-    await multitask(
-        # Reel In
-        top_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        # Others Reel Out
-        bottom_right.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        top_right.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_left.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        # Stop all when one stalls
-        race=True,
-    )
+    travels = (travel_min, travel_max, travel_left_neighbor, travel_right_neighbor)
+    for j, travel in enumerate(travels):
+        for i in range(4):
+            travel[i] = calibration_tensioned[i] + values[5 + 4 * j + i]
 
+    return True
 
-print("Stage 2.1.1: Top Left Angle is at", top_left.angle())
 
-run_task_monitored(travel_to_top_left_zero_position())
+###########################################################
+# Kinematics
+###########################################################
 
-# Stage 2.1.2: Safe the top left zero position
-top_left_travel_min = top_left.angle()
 
-print("Stage 2.1.2: Top Left MIN Travel Angle is at", top_left_travel_min)
+def estimate_frame_size():
+    """
+    Estimates width and height of the motor rectangle in degrees of reel rotation from the neighbor travel.
+
+    A string is at its shortest when the disc is in the corner of its motor (travel_min). Each side is therefore
+    measured four times, once by each of its two motors and once by each motor of the opposite side. Assumes all
+    reels to have the same radius.
+    """
+    width = (
+        travel_min[TL]
+        - travel_left_neighbor[TL]
+        + travel_min[BR]
+        - travel_left_neighbor[BR]
+        + travel_min[TR]
+        - travel_right_neighbor[TR]
+        + travel_min[BL]
+        - travel_right_neighbor[BL]
+    ) / 4
+    height = (
+        travel_min[TL]
+        - travel_right_neighbor[TL]
+        + travel_min[BR]
+        - travel_right_neighbor[BR]
+        + travel_min[TR]
+        - travel_left_neighbor[TR]
+        + travel_min[BL]
+        - travel_left_neighbor[BL]
+    ) / 4
+
+    return width, height
+
+
+def inverse_kinematics(x: float, y: float):
+    """
+    Target angle of every motor, ordered as MOTORS, to place the disc at x, y within the frame.
+
+    The position is given in degrees of reel rotation from the top left corner. Each string is as long as the
+    distance of the disc to the corner of its motor, reeled out from its travel_min.
+    """
+    width, height = frame_size
+    angles = []
+
+    for i in range(4):
+        dx = x - CORNER_X[i] * width
+        dy = y - CORNER_Y[i] * height
+        angles.append(travel_min[i] - round(sqrt(dx * dx + dy * dy)))
+
+    return angles
 
-# Stage 2.1.3: Set top left to hold its current zero position
-top_left.hold()
 
-print("Stage 2.1.3: Top Left Angle is HOLDING")
+###########################################################
+# Monitoring
+###########################################################
 
 
-# Stage 2.1.4: Reel in all other motors until stalled
-async def tension_top_left_partners(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
-):
-    await multitask(
-        bottom_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        top_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-    )
+LOG_LOAD_FORMAT = "Speed deg/s (Load mNm) TL=%d (%d) BR=%d (%d) TR=%d (%d) BL=%d (%d)"
 
 
-print("Stage 2.1.4: Bottom Right Angle is at", bottom_right.angle())
-print("Stage 2.1.4: Top Right Angle is at", top_right.angle())
-print("Stage 2.1.4: Bottom Left Angle is at", bottom_left.angle())
+async def log_load(every_ms: int = 200, min_delta: int = 5, max_ms: int = 1000):
+    """
+    Logs speed and load of all motors, but only when any load changed by more than min_delta mNm since the last log.
 
-run_task_monitored(tension_top_left_partners())
+    While nothing changes, the polling interval backs off from every_ms up to max_ms.
+    """
+    logged = None
+    interval = every_ms
 
-# Stage 2.1.5: Safe travel ranges for bottom right, top right and bottom left
-bottom_right_travel_max = bottom_right.angle()
+    while True:
+        loads = [MOTORS[i].load() for i in range(4)]
 
-top_right_travel_right_neighbor = top_right.angle()
-bottom_left_travel_left_neighbor = bottom_left.angle()
+        if (
+            logged is None
+            or max(abs(loads[i] - logged[i]) for i in range(4)) > min_delta
+        ):
+            values = []
+            for i in range(4):
+                values += [MOTORS[i].speed(), loads[i]]
 
-print("Stage 2.1.5: Bottom Right MAX Travel Angle is at", bottom_right_travel_max)
-print(
-    "Stage 2.1.5: Top Right - Right Neighbor Travel Angle is at",
-    top_right_travel_right_neighbor,
-)
-print(
-    "Stage 2.1.5: Bottom Left - Left Neighbor Travel Angle is at",
-    bottom_left_travel_left_neighbor,
-)
+            print(LOG_LOAD_FORMAT % tuple(values))
+            logged = loads
+            interval = every_ms
+        else:
+            interval = min(interval * 2, max_ms)
 
-# Stage 2.1.6: Relax all motors
-relax_tension()
+        await wait(interval)
 
-print_parameter_status("Stage 2.1.6: Relaxed all motors")
 
+###########################################################
+# Solving Stages
+###########################################################
 
-# Stage 2.1.7: Go back to tensioned calibration origin
-async def move_to_tensioned_calibration_origin():
-    await multitask(
-        top_left.run_target(
-            speed=SPEED_MAX_ANGLE_PER_SEC,
-            target_angle=top_left_calibration_tensioned,
-            then=Stop.COAST,
-        ),
-        bottom_right.run_target(
-            speed=SPEED_MAX_ANGLE_PER_SEC,
-            target_angle=bottom_right_calibration_tensioned,
-            then=Stop.COAST,
-        ),
-        top_right.run_target(
-            speed=SPEED_MAX_ANGLE_PER_SEC,
-            target_angle=top_right_calibration_tensioned,
-            then=Stop.COAST,
-        ),
-        bottom_left.run_target(
-            speed=SPEED_MAX_ANGLE_PER_SEC,
-            target_angle=bottom_left_calibration_tensioned,
-            then=Stop.COAST,
-        ),
-    )
 
+def stall(motor: Motor, speed: int, duty_limit: int, then: Stop = Stop.COAST):
+    """
+    Runs the motor until stalled, passing all arguments positionally.
 
-run_task_monitored(move_to_tensioned_calibration_origin())
+    Coasts by default. Only pass Stop.HOLD where the stalled angle has to be kept, e.g. for an anchor or until it is
+    read, as holding keeps the motor powered.
+    """
+    return motor.run_until_stalled(speed, then, duty_limit)
 
-print(
-    "Stage 2.1.7 (END): All motors tensioned to [TL, BR, TR, BL]",
-    top_left_calibration_tensioned,
-    bottom_right_calibration_tensioned,
-    top_right_calibration_tensioned,
-    bottom_left_calibration_tensioned,
-)
 
-# Stage 2.1.8: Relax all motors at the tensioned calibration origin
-relax_tension()
+async def stall_watchdog(
+    motor: Motor,
+    min_speed: int = STALL_WATCHDOG_SPEED,
+    window_ms: int = STALL_WATCHDOG_TIME,
+    every_ms: int = 20,
+):
+    """
+    Returns once the motor, after it started moving, turned slower than min_speed for longer than window_ms.
+    """
+    moving = False
+    slow = StopWatch()
 
-print_parameter_status(
-    "Stage 2.1.8: Relaxed all motors at the tensioned calibration origin"
-)
+    while True:
+        if abs(motor.speed()) >= min_speed:
+            moving = True
+            slow.reset()
+        elif moving and slow.time() > window_ms:
+            return
+
+        await wait(every_ms)
 
 
-# Stage 2.2.1: Go to bottom right zero position, stop all when stalled
-async def travel_to_bottom_right_zero_position(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
+async def stall_watched(
+    motor: Motor, speed: int, duty_limit: int, then: Stop = Stop.COAST
 ):
+    """
+    Like stall, but also stops as soon as the stall_watchdog sees the motor stalled.
+    """
     await multitask(
-        # Reel In
-        bottom_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        # Others Reel Out
-        top_left.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        top_right.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_left.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        # Stop all when one stalls
-        race=True,
+        stall(motor, speed, duty_limit, then), stall_watchdog(motor), race=True
     )
 
+    # The watchdog may have cancelled the run before it could apply then
+    if then == Stop.HOLD:
+        motor.hold()
+    else:
+        motor.stop()
 
-print("Stage 2.2.1: Bottom Right Angle is at", bottom_right.angle())
-
-run_task_monitored(travel_to_bottom_right_zero_position())
 
-# Stage 2.2.2: Safe the bottom right zero position
-bottom_right_travel_min = bottom_right.angle()
+async def load_watchdog(motor: Motor, min_load: int, every_ms: int = 10):
+    """
+    Returns once the load of the motor reached min_load.
+    """
+    while abs(motor.load()) < min_load:
+        await wait(every_ms)
 
-print("Stage 2.2.2: Bottom Right MIN Travel Angle is at", bottom_right_travel_min)
 
-# Stage 2.2.3: Set bottom right to hold its current zero position
-bottom_right.hold()
+async def run_until_stalled_approach(
+    motor: Motor,
+    duty_limit: int,
+    speed_hi: int = SPEED_CAL_APPROACH,
+    speed_lo: int = SPEED_CAL_IN,
+    slow_down_load: int = APPROACH_SLOW_DOWN_LOAD,
+):
+    """
+    Reels in at speed_hi until the load reaches slow_down_load, then continues at speed_lo until stalled.
+
+    The fast approach covers the slack of the string, which is most of the way. It is duty limited like any stall, so
+    it can not pull beyond the clutch should the load be missed. As soon as the string takes up load, the motor slows
+    down, so the stall itself is always detected at speed_lo and as precise as a plain run at speed_lo.
+    """
+    if speed_hi > speed_lo:
+        await multitask(
+            stall(motor, speed_hi, duty_limit),
+            load_watchdog(motor, slow_down_load),
+            race=True,
+        )
 
-print("Stage 2.2.3: Bottom Right Angle is HOLDING")
+    # Hold the stall to keep the string under tension
+    await stall_watched(motor, speed_lo, duty_limit, Stop.HOLD)
 
 
-# Stage 2.2.4: Reel in all other motors until stalled
-async def tension_bottom_right_partners(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
+# Stage 1.1: Make sure everything is in tension
+async def bring_under_tension(
+    speed: int = SPEED_CAL_IN,
+    approach_speed: int = SPEED_CAL_APPROACH,
+    duty_limit: int = STALL_TENSION_CLUTCH_DUTY_LIMIT,
 ):
     await multitask(
-        top_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        top_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
+        *[
+            run_until_stalled_approach(
+                MOTORS[i],
+                duty_limit,
+                speed_hi=approach_speed,
+                speed_lo=speed,
+            )
+            for i in range(4)
+        ]
     )
 
 
-print("Stage 2.2.4: Top Left Angle is at", top_left.angle())
-print("Stage 2.2.4: Top Right Angle is at", top_right.angle())
-print("Stage 2.2.4: Bottom Left Angle is at", bottom_left.angle())
-
-run_task_monitored(tension_bottom_right_partners())
-
-# Stage 2.2.5: Safe travel ranges for top left, top right and bottom left
-top_left_travel_max = top_left.angle()
-
-top_right_travel_left_neighbor = top_right.angle()
-bottom_left_travel_right_neighbor = bottom_left.angle()
-
-print("Stage 2.2.5: Top Left MAX Travel Angle is at", top_left_travel_max)
-print(
-    "Stage 2.2.5: Top Right - Left Neighbor Travel Angle is at",
-    top_right_travel_left_neighbor,
-)
-print(
-    "Stage 2.2.5: Bottom Left - Right Neighbor Travel Angle is at",
-    bottom_left_travel_right_neighbor,
-)
-
-# Stage 2.2.6: Relax all motors
-relax_tension()
-
-print_parameter_status("Stage 2.2.6: Relaxed all motors")
-
-# Stage 2.2.7: Go back to tensioned calibration origin
-run_task_monitored(move_to_tensioned_calibration_origin())
-
-print(
-    "Stage 2.2.7 (END): All motors tensioned to [TL, BR, TR, BL]",
-    top_left_calibration_tensioned,
-    bottom_right_calibration_tensioned,
-    top_right_calibration_tensioned,
-    bottom_left_calibration_tensioned,
-)
-
-# Stage 2.2.8: Relax all motors at the tensioned calibration origin
-relax_tension()
+# Stage 1.2: Relax all motors for a brief moment to relax the clutch
+async def relax_tension(
+    speed: int = SPEED_CAL_OUT,
+    time: int = RELAX_TIME,
+    add_wait: int = RELAX_SETTLE_TIME,
+):
+    await multitask(
+        *[
+            MOTORS[i].run_time(
+                speed=speed,
+                time=time,
+                then=Stop.COAST,
+            )
+            for i in range(4)
+        ]
+    )
 
-print_parameter_status(
-    "Stage 2.2.8: Relaxed all motors at the tensioned calibration origin"
-)
+    # Let the springs recover
+    await wait(add_wait)
 
 
-# Stage 2.3.1: Go to bottom left zero position, stop all when stalled
-async def travel_to_bottom_left_zero_position(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
+# Stage 2.x.1: Go to a corners zero position, stop all when stalled
+async def travel_to_corner(
+    index: int,
+    speed_in: int = SPEED_CAL_IN,
+    speed_out: int = SPEED_CAL_OUT,
+    duty_limit: int = STALL_COLLISION_CLUTCH_DUTY_LIMIT,
 ):
     await multitask(
         # Reel In
-        bottom_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        # Others Reel Out
-        top_left.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        top_right.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_right.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
+        stall_watched(MOTORS[index], speed_in, duty_limit, Stop.HOLD),
+        # Others Reel Out, coasting as they are tensioned right after
+        *[stall(MOTORS[i], speed_out, duty_limit) for i in range(4) if i != index],
         # Stop all when one stalls
         race=True,
     )
 
 
-print("Stage 2.3.1: Bottom Left Angle is at", bottom_left.angle())
-
-run_task_monitored(travel_to_bottom_left_zero_position())
-
-# Stage 2.3.2: Safe the bottom left zero position
-bottom_left_travel_min = bottom_left.angle()
-
-print("Stage 2.3.2: Bottom Left MIN Travel Angle is at", bottom_left_travel_min)
-
-# Stage 2.3.3: Set bottom left to hold its current zero position
-bottom_right.hold()
-
-print("Stage 2.3.3: Bottom Left Angle is HOLDING")
-
-
-# Stage 2.3.4: Reel in all other motors until stalled
-async def tension_bottom_left_partners(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
+# Stage 2.x.4: Reel in all motors except the held one until stalled
+async def tension_partners_of(
+    held: int,
+    speed: int = SPEED_CAL_IN,
+    approach_speed: int = SPEED_CAL_APPROACH,
+    duty_limit: int = STALL_TENSION_CLUTCH_DUTY_LIMIT,
 ):
     await multitask(
-        top_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        top_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
+        *[
+            run_until_stalled_approach(
+                MOTORS[i],
+                duty_limit,
+                speed_hi=approach_speed,
+                speed_lo=speed,
+            )
+            for i in range(4)
+            if i != held
+        ]
     )
 
 
-print("Stage 2.3.4: Top Left Angle is at", top_left.angle())
-print("Stage 2.3.4: Top Right Angle is at", top_right.angle())
-print("Stage 2.3.4: Bottom Right Angle is at", bottom_right.angle())
-
-run_task_monitored(tension_bottom_left_partners())
-
-# Stage 2.3.5: Safe travel ranges for top left, top right and bottom left
-top_right_travel_max = top_right.angle()
+# Stage 2.5: Go back to tensioned calibration origin
+async def move_to_tensioned_calibration_origin():
+    await multitask(
+        *[
+            MOTORS[i].run_target(
+                speed=SPEED_MAX_ANGLE_PER_SEC,
+                target_angle=calibration_tensioned[i],
+                then=Stop.COAST,
+            )
+            for i in range(4)
+        ]
+    )
 
-top_left_travel_right_neighbor = top_left.angle()
-bottom_right_travel_left_neighbor = bottom_right.angle()
 
-print("Stage 2.3.5: Top Right MAX Travel Angle is at", top_right_travel_max)
-print(
-    "Stage 2.3.5: Top Left - Right Neighbor Travel Angle is at",
-    top_left_travel_right_neighbor,
-)
-print(
-    "Stage 2.3.5: Bottom Right - Left Neighbor Travel Angle is at",
-    bottom_right_travel_left_neighbor,
+CORNER_TABLE = (
+    (TL, BR, BL, TR),
+    (BR, TL, TR, BL),
+    (BL, TR, BR, TL),
+    (TR, BL, TL, BR),
 )
+"""
+Calibration sequence, one row per corner.
+
+Each row is (held, sets_max, sets_left_neighbor, sets_right_neighbor): The held motor reels the disc into its corner
+which is its MIN travel. While it holds, the partners are tensioned. The opposite motor is then at its MAX travel and
+the two neighbors record their respective neighbor travel angle.
+"""
 
-# Stage 2.3.6: Relax all motors
-relax_tension()
 
-print_parameter_status("Stage 2.3.6: Relaxed all motors")
+# Stage 3.2: Go to the center of the travel ranges
+async def travel_to_center(
+    speed: int = SPEED_MAX_ANGLE_PER_SEC,
+):
+    await multitask(
+        *[
+            MOTORS[i].run_target(
+                speed=speed,
+                target_angle=travel_center[i],
+                then=Stop.HOLD,
+            )
+            for i in range(4)
+        ]
+    )
 
-# Stage 2.3.7: Go back to tensioned calibration origin
-run_task_monitored(move_to_tensioned_calibration_origin())
 
-print(
-    "Stage 2.3.7 (END): All motors tensioned to [TL, BR, TR, BL]",
-    top_left_calibration_tensioned,
-    bottom_right_calibration_tensioned,
-    top_right_calibration_tensioned,
-    bottom_left_calibration_tensioned,
-)
+# Stage 3.1: Claculate the center of the travel ranges
+def calculate_center():
+    # On a rectangular frame, the center is where all strings are as long as half the diagonal. It is solved from the
+    # frame size, which averages all neighbor travels. travel_max is only recorded for diagnostics.
+    frame_size[:] = estimate_frame_size()
+    travel_center[:] = inverse_kinematics(frame_size[0] / 2, frame_size[1] / 2)
 
-# Stage 2.3.8: Relax all motors at the tensioned calibration origin
-relax_tension()
 
-print_parameter_status(
-    "Stage 2.3.8: Relaxed all motors at the tensioned calibration origin"
-)
+CORNER_LOG_FORMAT = """Stage 2.%d.2: %s MIN Travel Angle is at %d
+Stage 2.%d.3: %s Angle is HOLDING
+Stage 2.%d.4: Partners of %s tensioned
+Stage 2.%d.5: %s MAX Travel Angle is at %d
+Stage 2.%d.5: %s - Left Neighbor Travel Angle is at %d
+Stage 2.%d.5: %s - Right Neighbor Travel Angle is at %d"""
 
 
-# Stage 2.4.1: Go to top right zero position, stop all when stalled
-async def travel_to_top_right_zero_position(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
+# Stage 2.x: Calibrate from one corner, parameterized by a row of the CORNER_TABLE
+async def calibrate_corner(
+    stage: int, held: int, max_index: int, left_index: int, right_index: int
 ):
-    await multitask(
-        # Reel In
-        top_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        # Others Reel Out
-        top_left.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_left.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_right.run_until_stalled(
-            speed=speed * reel_out,
-            then=Stop.HOLD,
-            duty_limit=STALL_COLLISION_CLUTCH_DUTY_LIMIT,
-        ),
-        # Stop all when one stalls
-        race=True,
+    # Stage 2.x.1: Go to the corners zero position, stop all when stalled
+    print(
+        "Stage 2.%d.1: %s Angle is at %d" % (stage, LABELS[held], MOTORS[held].angle())
     )
 
+    await travel_to_corner(held)
+
+    # Stage 2.x.2: Safe the corners zero position, right as the race ended
+    travel_min[held] = MOTORS[held].angle()
+
+    # Stage 2.x.3: Set the corner to hold its current zero position
+    MOTORS[held].hold()
+
+    # Stage 2.x.4: Reel in all other motors until stalled, straight away
+    await tension_partners_of(held)
+
+    # Stage 2.x.5: Safe travel ranges for the opposite and the neighboring motors
+    angles = snapshot()
+
+    travel_max[max_index] = angles[max_index]
+
+    travel_left_neighbor[left_index] = angles[left_index]
+    travel_right_neighbor[right_index] = angles[right_index]
+
+    print(
+        CORNER_LOG_FORMAT
+        % (
+            stage,
+            LABELS[held],
+            travel_min[held],
+            stage,
+            LABELS[held],
+            stage,
+            LABELS[held],
+            stage,
+            LABELS[max_index],
+            travel_max[max_index],
+            stage,
+            LABELS[left_index],
+            travel_left_neighbor[left_index],
+            stage,
+            LABELS[right_index],
+            travel_right_neighbor[right_index],
+        )
+    )
 
-print("Stage 2.4.1: Top Right Angle is at", top_right.angle())
-
-run_task_monitored(travel_to_top_right_zero_position())
-
-# Stage 2.4.2: Safe the top right zero position
-top_right_travel_min = top_right.angle()
+    # Stage 2.x.6: Relax all motors
+    await relax_tension()
 
-print("Stage 2.4.2: Top Right MIN Travel Angle is at", top_right_travel_min)
+    if VERBOSE:
+        print_parameter_status("Stage 2.%d.6: Relaxed all motors" % stage)
 
-# Stage 2.4.3: Set top right to hold its current zero position
-top_right.hold()
 
-print("Stage 2.4.3: Top Right Angle is HOLDING")
+# Stage 2: Find the travel ranges of all motors, one corner after another
+async def calibrate_corners():
+    for stage, row in enumerate(CORNER_TABLE, 1):
+        await calibrate_corner(stage, *row)
 
+    # Stage 2.5: Go back to tensioned calibration origin, once all corners are done
+    #
+    # Not needed in between corners, as travelling to the next corner pulls the disc away from wherever it is.
+    await move_to_tensioned_calibration_origin()
 
-# Stage 2.4.4: Reel in all other motors until stalled
-async def tension_top_right_partners(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC_CALIBRATION,
-):
-    await multitask(
-        top_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_left.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
-        bottom_right.run_until_stalled(
-            speed=speed * reel_in,
-            then=Stop.HOLD,
-            duty_limit=STALL_TENSION_CLUTCH_DUTY_LIMIT,
-        ),
+    print(
+        "Stage 2.5 (END): All motors tensioned to %s"
+        % format_angles(calibration_tensioned)
     )
 
 
-print("Stage 2.4.4: Top Left Angle is at", top_left.angle())
-print("Stage 2.4.4: Bottom Left Angle is at", bottom_left.angle())
-print("Stage 2.4.4: Bottom Right Angle is at", bottom_right.angle())
+async def solve():
+    # Stage 1.1: Make sure everything is in tension
+    calibration_initial[:] = snapshot()
 
-run_task_monitored(tension_top_right_partners())
+    print(
+        "Stage 1.1 (START): Tensioning all motors from %s"
+        % format_angles(calibration_initial)
+    )
 
-# Stage 2.4.5: Safe travel ranges for top left, top right and bottom left
-bottom_left_travel_max = bottom_left.angle()
+    await bring_under_tension()
 
-top_left_travel_left_neighbor = top_left.angle()
-bottom_right_travel_right_neighbor = bottom_right.angle()
+    calibration_tensioned[:] = snapshot()
 
-print("Stage 2.4.5: Bottom Left MAX Travel Angle is at", bottom_left_travel_max)
-print(
-    "Stage 2.4.5: Top Left - Left Neighbor Travel Angle is at",
-    top_left_travel_left_neighbor,
-)
-print(
-    "Stage 2.4.5: Bottom Right - Right Neighbor Travel Angle is at",
-    bottom_right_travel_right_neighbor,
-)
+    print(
+        "Stage 1.1 (END): All motors tensioned to %s"
+        % format_angles(calibration_tensioned)
+    )
 
-# Stage 2.4.6: Relax all motors
-relax_tension()
+    # Stage 1.2: Relax all motors for a brief moment to relax the clutch
+    await relax_tension()
 
-print_parameter_status("Stage 2.4.6: Relaxed all motors")
+    # Stage 1.3: Restore the travel ranges of a previous run to skip Stage 2, unless asked to recalibrate
+    calibration_restored = not recalibrate and load_calibration()
 
-# Stage 2.4.7: Go back to tensioned calibration origin
-run_task_monitored(move_to_tensioned_calibration_origin())
+    print(
+        "Stage 1.2 (END): All motors relaxed %s\nStage 1.3: Stored calibration restored %s"
+        % (format_angles(snapshot()), calibration_restored)
+    )
 
-print(
-    "Stage 2.4.7 (END): All motors tensioned to [TL, BR, TR, BL]",
-    top_left_calibration_tensioned,
-    bottom_right_calibration_tensioned,
-    top_right_calibration_tensioned,
-    bottom_left_calibration_tensioned,
-)
+    if not calibration_restored:
+        await calibrate_corners()
 
-# Stage 2.4.8: Relax all motors at the tensioned calibration origin
-relax_tension()
+        # Stage 2.6: Relax all motors at the tensioned calibration origin
+        await relax_tension()
 
-print_parameter_status(
-    "Stage 2.4.8: Relaxed all motors at the tensioned calibration origin"
-)
+        if VERBOSE:
+            print_parameter_status(
+                "Stage 2.6: Relaxed all motors at the tensioned calibration origin"
+            )
 
-# Stage 3.1: Claculate the center of the travel ranges
-top_left_travel_center = (
-    top_left_travel_max - top_left_travel_min
-) / 2 + top_left_travel_min
-bottom_right_travel_center = (
-    bottom_right_travel_max - bottom_right_travel_min
-) / 2 + bottom_right_travel_min
+    # Stage 3.1: Calculate the center of the travel ranges
+    calculate_center()
 
-bottom_left_travel_center = (
-    bottom_left_travel_max - bottom_left_travel_min
-) / 2 + bottom_left_travel_min
-top_right_travel_center = (
-    top_right_travel_max - top_right_travel_min
-) / 2 + top_right_travel_min
+    # Stage 3.1: Store freshly calibrated travel ranges for the next run
+    if not calibration_restored:
+        save_calibration()
 
+    print_parameter_status("Stage 3.1: Claculate the center of the travel ranges")
 
-print_parameter_status("Stage 3.1: Claculate the center of the travel ranges")
+    # Stage 3.2: Go to the center of the travel ranges
+    await travel_to_center()
 
+    print_parameter_status("Stage 3.2: Go to the center of the travel ranges")
 
-# Stage 3.2: Go to the center of the travel ranges
-async def travel_to_center(
-    speed: int = SPEED_MAX_ANGLE_PER_SEC,
-):
-    await multitask(
-        top_left.run_target(
-            speed=speed,
-            target_angle=top_left_travel_center,
-            then=Stop.HOLD,
-        ),
-        bottom_right.run_target(
-            speed=speed,
-            target_angle=bottom_right_travel_center,
-            then=Stop.HOLD,
-        ),
-        top_right.run_target(
-            speed=speed,
-            target_angle=top_right_travel_center,
-            then=Stop.HOLD,
-        ),
-        bottom_left.run_target(
-            speed=speed,
-            target_angle=bottom_left_travel_center,
-            then=Stop.HOLD,
-        ),
-    )
 
+async def main():
+    """
+    Solves all stages while logging the motor load, in one task for the whole program.
+
+    NOTE: No extra heartbeat task is needed to keep log_load responsive. multitask resumes every awaitable on each
+    pass of the scheduler, and motor awaitables such as run_until_stalled yield on every pass while the motor runs.
+    What does delay wakeups on the hub is blocking stdout, which is why log_load only prints on change.
+    """
+    await multitask(solve(), log_load(), race=True)
 
-run_task_monitored(travel_to_center())
 
-print_parameter_status("Stage 3.2: Go to the center of the travel ranges")
+run_task(main())
@@ -3,7 +3,7 @@
 from pybricks.hubs import InventorHub
 from pybricks.parameters import Port
 from pybricks.pupdevices import Motor
-from pybricks.tools import wait
+from pybricks.tools import run_task, wait
 
 hub = InventorHub()
 
@@ -14,15 +14,22 @@ motor_br = Motor(Port.F)
 motor_tr = Motor(Port.B)
 motor_bl = Motor(Port.E)
 
-# Reel out
-motor_tl.run(300)
-motor_br.run(300)
 
-motor_tr.run(-300)
-motor_bl.run(-300)
+async def main():
+    # Reel out
+    motor_tl.run(300)
+    motor_br.run(300)
 
-# For two seconds
+    motor_tr.run(-300)
+    motor_bl.run(-300)
 
-wait(2000)
+    # For two seconds
+    await wait(2000)
 
-print("Tension Array Relaxed")
+    for motor in (motor_tl, motor_br, motor_tr, motor_bl):
+        motor.stop()
+
+    print("Tension Array Relaxed")
+
+
+run_task(main())